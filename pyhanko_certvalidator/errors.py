@@ -1,6 +1,6 @@
 # coding: utf-8
 from datetime import datetime
-from typing import Optional, Type, TypeVar
+from typing import Callable, Optional, Type, TypeVar, Union
 
 from asn1crypto.crl import CRLReason
 from cryptography.exceptions import InvalidSignature
@@ -57,23 +57,97 @@ class OCSPFetchError(OCSPValidationError):
     pass
 
 
+LazyMessage = Union[str, Callable[[], str]]
+"""
+An error message, or a zero-argument function producing one.
+The function is only called when the message is actually needed.
+Note that it must not depend on state that may change after the error is
+raised (e.g. :class:`.ValProcState`).
+"""
+
+# the C-level storage behind BaseException.args
+_EXC_ARGS = BaseException.args
+
+
 class ValidationError(Exception):
-    def __init__(self, message: str):
-        self.failure_msg = message
-        super().__init__(message)
+    # Exceptions always support __dict__, but declaring slots for our own
+    # attributes means it doesn't have to be materialised.
+    __slots__ = ('_failure_msg', '_msg_factory')
+
+    def __init__(self, message: LazyMessage):
+        if callable(message):
+            # Some of these errors are routinely caught and discarded
+            # (e.g. in the AdES time slide), so we format the message
+            # on demand.
+            self._failure_msg: Optional[str] = None
+            self._msg_factory: Optional[Callable[[], str]] = message
+            super().__init__()
+        else:
+            self._failure_msg = message
+            self._msg_factory = None
+            super().__init__(message)
+
+    def _format_msg(self):
+        factory = self._msg_factory
+        if factory is not None:
+            msg = self._failure_msg = factory()
+            self._msg_factory = None
+            _EXC_ARGS.__set__(self, (msg,))
+
+    @property
+    def failure_msg(self) -> str:
+        self._format_msg()
+        return self._failure_msg  # type: ignore[return-value]
+
+    @failure_msg.setter
+    def failure_msg(self, value: str):
+        self._msg_factory = None
+        self._failure_msg = value
+
+    # Make sure that code looking at the arguments never notices the
+    # difference with an eagerly formatted message.
+
+    @property  # type: ignore[override]
+    def args(self):
+        self._format_msg()
+        return _EXC_ARGS.__get__(self)
+
+    @args.setter
+    def args(self, value):
+        self._format_msg()
+        _EXC_ARGS.__set__(self, value)
+
+    def __str__(self):
+        self._format_msg()
+        return super().__str__()
+
+    def __repr__(self):
+        self._format_msg()
+        return super().__repr__()
+
+    def __reduce__(self):
+        self._format_msg()
+        return super().__reduce__()
 
 
 TPathErr = TypeVar('TPathErr', bound='PathValidationError')
 
 
 class PathValidationError(ValidationError):
+    __slots__ = (
+        'is_ee_cert',
+        'is_side_validation',
+        'current_path',
+        'original_path',
+    )
+
     @classmethod
     def from_state(
-        cls: Type[TPathErr], msg: str, proc_state: ValProcState
+        cls: Type[TPathErr], msg: LazyMessage, proc_state: ValProcState
     ) -> TPathErr:
         return cls(msg, proc_state=proc_state)
 
-    def __init__(self, msg: str, *, proc_state: ValProcState):
+    def __init__(self, msg: LazyMessage, *, proc_state: ValProcState):
         self.is_ee_cert = proc_state.is_ee_cert
         self.is_side_validation = proc_state.is_side_validation
         current = proc_state.cert_path_stack.head
@@ -93,13 +167,18 @@ class RevokedError(PathValidationError):
         revinfo_type: str,
         proc_state: ValProcState,
     ):
-        reason_str = reason.human_friendly
-        date = revocation_dt.strftime('%Y-%m-%d')
-        time = revocation_dt.strftime('%H:%M:%S')
-        msg = (
-            f'{revinfo_type} indicates {proc_state.describe_cert()} '
-            f'was revoked at {time} on {date}, due to {reason_str}.'
-        )
+        # proc_state is mutable, so this has to be evaluated right away
+        cert_descr = proc_state.describe_cert()
+
+        def msg():
+            reason_str = reason.human_friendly
+            date = revocation_dt.strftime('%Y-%m-%d')
+            time = revocation_dt.strftime('%H:%M:%S')
+            return (
+                f'{revinfo_type} indicates {cert_descr} '
+                f'was revoked at {time} on {date}, due to {reason_str}.'
+            )
+
         return RevokedError(msg, reason, revocation_dt, proc_state)
 
     def __init__(
@@ -115,11 +194,11 @@ class RevokedError(PathValidationError):
 
 
 class InsufficientRevinfoError(PathValidationError):
-    pass
+    __slots__ = ()
 
 
 class InsufficientPOEError(PathValidationError):
-    pass
+    __slots__ = ()
 
 
 class ExpiredError(PathValidationError):
@@ -130,11 +209,15 @@ class ExpiredError(PathValidationError):
         expired_dt: datetime,
         proc_state: ValProcState,
     ):
-        msg = (
-            f"The path could not be validated because "
-            f"{proc_state.describe_cert()} expired "
-            f"{expired_dt.strftime('%Y-%m-%d %H:%M:%SZ')}"
-        )
+        cert_descr = proc_state.describe_cert()
+
+        def msg():
+            return (
+                f"The path could not be validated because "
+                f"{cert_descr} expired "
+                f"{expired_dt.strftime('%Y-%m-%d %H:%M:%SZ')}"
+            )
+
         return ExpiredError(msg, expired_dt, proc_state)
 
     def __init__(self, msg, expired_dt: datetime, proc_state: ValProcState):
@@ -150,11 +233,15 @@ class NotYetValidError(PathValidationError):
         valid_from: datetime,
         proc_state: ValProcState,
     ):
-        msg = (
-            f"The path could not be validated because "
-            f"{proc_state.describe_cert()} is not valid until "
-            f"{valid_from.strftime('%Y-%m-%d %H:%M:%SZ')}"
-        )
+        cert_descr = proc_state.describe_cert()
+
+        def msg():
+            return (
+                f"The path could not be validated because "
+                f"{cert_descr} is not valid until "
+                f"{valid_from.strftime('%Y-%m-%d %H:%M:%SZ')}"
+            )
+
         return NotYetValidError(msg, valid_from, proc_state)
 
     def __init__(self, msg, valid_from: datetime, proc_state: ValProcState):
@@ -163,7 +250,7 @@ class NotYetValidError(PathValidationError):
 
 
 class InvalidCertificateError(ValidationError):
-    pass
+    __slots__ = ()
 
 
 class DisallowedAlgorithmError(PathValidationError):
@@ -176,7 +263,7 @@ class DisallowedAlgorithmError(PathValidationError):
     @classmethod
     def from_state(
         cls,
-        msg: str,
+        msg: LazyMessage,
         proc_state: ValProcState,
         banned_since: Optional[datetime] = None,
     ) -> 'DisallowedAlgorithmError':
@@ -184,7 +271,7 @@ class DisallowedAlgorithmError(PathValidationError):
 
 
 class InvalidAttrCertificateError(InvalidCertificateError):
-    pass
+    __slots__ = ()
 
 
 class PSSParameterMismatch(InvalidSignature):
@@ -4,8 +4,8 @@ __all__ = ['PastValidatePrecheckFailure', 'TimeSlideFailure']
 
 
 class PastValidatePrecheckFailure(ValidationError):
-    pass
+    __slots__ = ()
 
 
 class TimeSlideFailure(ValidationError):
-    pass
+    __slots__ = ()
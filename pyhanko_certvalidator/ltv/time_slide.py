@@ -218,27 +218,35 @@ async def _time_slide(
 
         proc_state = ValProcState(cert_path_stack=new_path_stack)
 
+        # These errors are usually wrapped into a TimeSlideFailure, so
+        # the messages are only formatted when someone asks for them.
         if poe_manager[cert] > control_time:
             raise InsufficientPOEError.from_state(
-                f"No proof of existence available for certificate "
-                f"{cert.subject.human_friendly} at control time "
-                f"{control_time.isoformat()}.",
+                lambda: (
+                    f"No proof of existence available for certificate "
+                    f"{cert.subject.human_friendly} at control time "
+                    f"{control_time.isoformat()}."
+                ),
                 proc_state,
             )
-        if not crls and not ocsps:
-            if isinstance(cert, x509.Certificate):
-                ident = cert.subject.human_friendly
-            else:
-                ident = "attribute certificate"
-
-            # don't raise an error for revo-exempt certs (OCSP responders)
-            if cert.ocsp_no_check_value is None:
-                raise InsufficientRevinfoError.from_state(
-                    f"No revocation info from before {control_time.isoformat()}"
-                    f" found for certificate {ident}.",
-                    proc_state,
+        # don't raise an error for revo-exempt certs (OCSP responders)
+        if not crls and not ocsps and cert.ocsp_no_check_value is None:
+
+            def _no_revinfo_msg():
+                if isinstance(cert, x509.Certificate):
+                    ident = cert.subject.human_friendly
+                else:
+                    ident = "attribute certificate"
+                return (
+                    f"No revocation info from before "
+                    f"{control_time.isoformat()} found for certificate "
+                    f"{ident}."
                 )
 
+            raise InsufficientRevinfoError.from_state(
+                _no_revinfo_msg, proc_state
+            )
+
         once_revoked = False
         most_recent_crl = None
         # We always take the chain of trust of a CRL/OCSP response
@@ -51,6 +51,8 @@ class IssuedItemContainer(abc.ABC):
     A container for some data object issued by an entity (e.g. a certificate).
     """
 
+    __slots__ = ()
+
     @property
     def issuance_date(self) -> Optional[datetime]:
         """
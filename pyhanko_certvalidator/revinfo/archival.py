@@ -1,10 +1,21 @@
 import abc
 import enum
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Iterable, List, Optional, TypeVar, Union
+import weakref
+from dataclasses import FrozenInstanceError, dataclass, fields
+from datetime import datetime, timezone
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-from asn1crypto import algos, crl, ocsp
+from asn1crypto import algos, core, crl, ocsp, x509
 
 from pyhanko_certvalidator._types import type_name
 from pyhanko_certvalidator.ltv.types import (
@@ -24,6 +35,7 @@ __all__ = [
     'OCSPContainer',
     'CRLContainer',
     'sort_freshest_first',
+    'batch_usable_at',
     'process_legacy_crl_input',
     'process_legacy_ocsp_input',
 ]
@@ -96,6 +108,8 @@ class RevinfoContainer(IssuedItemContainer, abc.ABC):
     A container for a piece of revocation information.
     """
 
+    __slots__ = ()
+
     def usable_at(
         self, policy: CertRevTrustPolicy, timing_params: ValidationTimingParams
     ) -> RevinfoUsability:
@@ -112,6 +126,13 @@ class RevinfoContainer(IssuedItemContainer, abc.ABC):
         """
         raise NotImplementedError
 
+    def _validity_window(
+        self,
+    ) -> Optional[Tuple[Optional[datetime], Optional[datetime]]]:
+        # (this_update, next_update) pair to judge freshness against, or None
+        # if the subclass's usable_at() doesn't work in terms of such a window.
+        return None
+
     @property
     def revinfo_sig_mechanism_used(
         self,
@@ -124,6 +145,7 @@ class RevinfoContainer(IssuedItemContainer, abc.ABC):
 
 
 RevInfoType = TypeVar('RevInfoType', bound=RevinfoContainer)
+_C = TypeVar('_C', bound=type)
 
 
 def sort_freshest_first(lst: Iterable[RevInfoType]) -> List[RevInfoType]:
@@ -152,71 +174,119 @@ def sort_freshest_first(lst: Iterable[RevInfoType]) -> List[RevInfoType]:
     return sorted(lst, key=_key, reverse=True)
 
 
-def _freshness_delta(policy, this_update, next_update, time_tolerance):
-    freshness_delta = policy.freshness
-    if freshness_delta is None:
-        if next_update is not None and next_update >= this_update:
-            freshness_delta = next_update - this_update
-    if freshness_delta is not None:
-        freshness_delta = abs(freshness_delta) + time_tolerance
-    return freshness_delta
+# Judgments without a cutoff date are immutable and carry no other state,
+# so there's no need to instantiate them over and over again.
+_USABLE = RevinfoUsability(RevinfoUsabilityRating.OK)
+_UNCLEAR = RevinfoUsability(RevinfoUsabilityRating.UNCLEAR)
+_TOO_NEW = RevinfoUsability(RevinfoUsabilityRating.TOO_NEW)
 
+_RevinfoJudge = Callable[
+    [Optional[datetime], Optional[datetime]], RevinfoUsability
+]
 
-def _judge_revinfo(
-    this_update: Optional[datetime],
-    next_update: Optional[datetime],
-    policy: CertRevTrustPolicy,
-    timing_params: ValidationTimingParams,
-) -> RevinfoUsability:
-    if this_update is None:
-        return RevinfoUsability(RevinfoUsabilityRating.UNCLEAR)
 
-    validation_time = timing_params.validation_time
-    time_tolerance = timing_params.time_tolerance
+# Revinfo issued after the validation time may need to be considered
+# in AdES point-in-time validation.
+# In the legacy "default" policy, this is controlled by the retroactive
+# revinfo switch.
+# See also 5.2.5.4 in ETSI EN 319 102-1.
 
-    # Revinfo issued after the validation time may need to be considered
-    # in AdES point-in-time validation.
-    # In the legacy "default" policy, this is controlled by the retroactive
-    # revinfo switch.
 
-    # see 5.2.5.4 in ETSI EN 319 102-1
-    if policy.freshness_req_type == FreshnessReqType.TIME_AFTER_SIGNATURE:
+def _time_after_signature_judge(
+    policy: CertRevTrustPolicy, timing_params: ValidationTimingParams
+) -> _RevinfoJudge:
+    time_tolerance = timing_params.time_tolerance
+    signature_poe_time = timing_params.best_signature_time
+    # If the policy fixes the freshness interval, the tolerance and the
+    # resulting cutoff date can be computed right away.
+    freshness = policy.freshness
+    fixed_delta = None if freshness is None else abs(freshness) + time_tolerance
+    stale_before = (
+        None if fixed_delta is None else signature_poe_time + fixed_delta
+    )
+
+    def _judge(this_update, next_update):
+        if this_update is None:
+            return _UNCLEAR
         # check whether the revinfo was generated sufficiently long _after_
         # the (presumptive) signature time
-        freshness_delta = _freshness_delta(
-            policy, this_update, next_update, time_tolerance
-        )
-        if freshness_delta is None:
-            return RevinfoUsability(RevinfoUsabilityRating.UNCLEAR)
-        signature_poe_time = timing_params.best_signature_time
+        if stale_before is not None:
+            if this_update < stale_before:
+                return RevinfoUsability(
+                    RevinfoUsabilityRating.STALE,
+                    last_usable_at=this_update + fixed_delta,
+                )
+            return _USABLE
+        if next_update is None or next_update < this_update:
+            return _UNCLEAR
+        freshness_delta = next_update - this_update + time_tolerance
         if this_update - signature_poe_time < freshness_delta:
             return RevinfoUsability(
                 RevinfoUsabilityRating.STALE,
                 last_usable_at=this_update + freshness_delta,
             )
-    elif (
-        policy.freshness_req_type
-        == FreshnessReqType.MAX_DIFF_REVOCATION_VALIDATION
-    ):
+        return _USABLE
+
+    return _judge
+
+
+def _max_diff_judge(
+    policy: CertRevTrustPolicy, timing_params: ValidationTimingParams
+) -> _RevinfoJudge:
+    validation_time = timing_params.validation_time
+    time_tolerance = timing_params.time_tolerance
+    # see _time_after_signature_judge
+    freshness = policy.freshness
+    fixed_delta = None if freshness is None else abs(freshness) + time_tolerance
+    stale_before = (
+        None if fixed_delta is None else validation_time - fixed_delta
+    )
+
+    def _judge(this_update, next_update):
+        if this_update is None:
+            return _UNCLEAR
         # check whether the difference between thisUpdate
         # and the validation time is small enough
 
-        # add time_tolerance to allow for additional time drift
-        freshness_delta = _freshness_delta(
-            policy, this_update, next_update, time_tolerance
-        )
-        if freshness_delta is None:
-            return RevinfoUsability(RevinfoUsabilityRating.UNCLEAR)
-
         # See ETSI EN 319 102-1, § 5.2.5.4, item 2)
         #  in particular, "too recent" doesn't seem to apply;
         #  the result is pass/fail
+        if stale_before is not None:
+            if this_update < stale_before:
+                return RevinfoUsability(
+                    RevinfoUsabilityRating.STALE,
+                    last_usable_at=this_update + fixed_delta,
+                )
+            return _USABLE
+
+        # add time_tolerance to allow for additional time drift
+        if next_update is None or next_update < this_update:
+            return _UNCLEAR
+        freshness_delta = next_update - this_update + time_tolerance
         if this_update < validation_time - freshness_delta:
             return RevinfoUsability(
                 RevinfoUsabilityRating.STALE,
                 last_usable_at=this_update + freshness_delta,
             )
-    elif policy.freshness_req_type == FreshnessReqType.DEFAULT:
+        return _USABLE
+
+    return _judge
+
+
+def _default_judge(
+    policy: CertRevTrustPolicy, timing_params: ValidationTimingParams
+) -> _RevinfoJudge:
+    validation_time = timing_params.validation_time
+    time_tolerance = timing_params.time_tolerance
+    retroactive = policy.retroactive_revinfo
+    # Shift the validation time instead of the revinfo's validity window,
+    # so that the tolerance doesn't need to be applied for every item.
+    latest_this_update = validation_time + time_tolerance
+    earliest_next_update = validation_time - time_tolerance
+
+    def _judge(this_update, next_update):
+        if this_update is None:
+            return _UNCLEAR
         # check whether the validation time falls within the
         # thisUpdate-nextUpdate window (non-AdES!!)
         if next_update is None:
@@ -227,18 +297,153 @@ def _judge_revinfo(
             # for historical point-in-time validation, this is disqualifying
             next_update = this_update + FRESHNESS_FALLBACK_VALIDITY_DEFAULT
 
-        retroactive = policy.retroactive_revinfo
-
-        if not retroactive and validation_time < this_update - time_tolerance:
-            return RevinfoUsability(RevinfoUsabilityRating.TOO_NEW)
-        if validation_time > next_update + time_tolerance:
+        if not retroactive and this_update > latest_this_update:
+            return _TOO_NEW
+        if next_update < earliest_next_update:
             return RevinfoUsability(
                 RevinfoUsabilityRating.STALE,
                 last_usable_at=next_update + time_tolerance,
             )
-    else:  # pragma: nocover
+        return _USABLE
+
+    return _judge
+
+
+_JUDGE_FACTORIES: Dict[
+    FreshnessReqType,
+    Callable[[CertRevTrustPolicy, ValidationTimingParams], _RevinfoJudge],
+] = {
+    FreshnessReqType.TIME_AFTER_SIGNATURE: _time_after_signature_judge,
+    FreshnessReqType.MAX_DIFF_REVOCATION_VALIDATION: _max_diff_judge,
+    FreshnessReqType.DEFAULT: _default_judge,
+}
+
+
+# The validators judge every piece of revinfo they come across against
+# the revinfo policy and timing parameters of the same validation context,
+# so hang on to the most recently built judge.
+# Both keys are frozen, and the entry keeps them alive, so comparing
+# by identity is safe.
+_last_judge: Optional[
+    Tuple[CertRevTrustPolicy, ValidationTimingParams, _RevinfoJudge]
+] = None
+
+
+def _make_revinfo_judge(
+    policy: CertRevTrustPolicy, timing_params: ValidationTimingParams
+) -> _RevinfoJudge:
+    # Resolve everything that only depends on the policy and the timing
+    # parameters up front, so that the resulting function can be applied
+    # to many pieces of revinfo.
+    global _last_judge
+    cached = _last_judge
+    if (
+        cached is not None
+        and cached[0] is policy
+        and cached[1] is timing_params
+    ):
+        return cached[2]
+    try:
+        factory = _JUDGE_FACTORIES[policy.freshness_req_type]
+    except KeyError:  # pragma: nocover
         raise NotImplementedError
-    return RevinfoUsability(RevinfoUsabilityRating.OK)
+    judge = factory(policy, timing_params)
+    _last_judge = (policy, timing_params, judge)
+    return judge
+
+
+def _judge_revinfo(
+    this_update: Optional[datetime],
+    next_update: Optional[datetime],
+    policy: CertRevTrustPolicy,
+    timing_params: ValidationTimingParams,
+) -> RevinfoUsability:
+    return _make_revinfo_judge(policy, timing_params)(this_update, next_update)
+
+
+def batch_usable_at(
+    containers: Iterable[RevinfoContainer],
+    policy: CertRevTrustPolicy,
+    timing_params: ValidationTimingParams,
+) -> List[RevinfoUsability]:
+    """
+    Assess the usability of several pieces of revocation information
+    against the same revocation information trust policy and timing
+    parameters.
+
+    This is equivalent to calling :meth:`.RevinfoContainer.usable_at` on
+    each container, but only evaluates the policy once.
+
+    :param containers:
+        The revocation information containers to judge.
+    :param policy:
+        The revocation information trust policy.
+    :param timing_params:
+        Timing-related information.
+    :return:
+        A list of :class:`.RevinfoUsability` judgments, in the same order
+        as the input.
+    """
+
+    judge = _make_revinfo_judge(policy, timing_params)
+    result = []
+    for container in containers:
+        window = container._validity_window()
+        if window is None:
+            result.append(container.usable_at(policy, timing_params))
+        else:
+            result.append(judge(*window))
+    return result
+
+
+def _fast_time(node) -> Optional[datetime]:
+    # Fast path for decoding the DER-encoded times in CRLs and OCSP responses.
+    # In DER, these are always of the form YYMMDDHHMMSSZ (UTCTime) or
+    # YYYYMMDDHHMMSSZ (GeneralizedTime), so we can skip asn1crypto's
+    # generic (and much slower) time parsing logic.
+    # Anything else (fractional seconds, offsets, ...) is left to asn1crypto.
+    if isinstance(node, x509.Time):
+        node = node.chosen
+    if isinstance(node, core.Void):
+        return None
+    contents = node.contents
+    try:
+        if isinstance(node, core.GeneralizedTime):
+            if (
+                len(contents) == 15
+                and contents[14:] == b'Z'
+                and contents[:14].isdigit()
+            ):
+                return datetime(
+                    int(contents[0:4]),
+                    int(contents[4:6]),
+                    int(contents[6:8]),
+                    int(contents[8:10]),
+                    int(contents[10:12]),
+                    int(contents[12:14]),
+                    tzinfo=timezone.utc,
+                )
+        elif isinstance(node, core.UTCTime):
+            if (
+                len(contents) == 13
+                and contents[12:] == b'Z'
+                and contents[:12].isdigit()
+            ):
+                year = int(contents[0:2])
+                # see RFC 5280, § 4.1.2.5.1
+                year += 1900 if year >= 50 else 2000
+                return datetime(
+                    year,
+                    int(contents[2:4]),
+                    int(contents[4:6]),
+                    int(contents[6:8]),
+                    int(contents[8:10]),
+                    int(contents[10:12]),
+                    tzinfo=timezone.utc,
+                )
+    except ValueError:
+        pass
+    return node.native
 
 
 def _extract_basic_ocsp_response(
@@ -256,6 +461,75 @@ def _extract_basic_ocsp_response(
     return response_bytes['response'].parsed
 
 
+def _frozen_setattr(self, name, value):
+    raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def _frozen_delattr(self, name):
+    raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+def _add_slots(*extra_slots: str) -> Callable[[_C], _C]:
+    # Poor man's version of @dataclass(slots=True), which needs
+    # Python 3.10: rebuild the dataclass with a slot for every field,
+    # so that containers (which are created in bulk) don't carry
+    # a per-instance __dict__.
+    def _decorate(cls: _C) -> _C:
+        cls_dict = dict(cls.__dict__)
+        field_names = tuple(f.name for f in fields(cls))
+        for name in field_names:
+            # drop the class attributes holding default values
+            cls_dict.pop(name, None)
+        cls_dict.pop('__dict__', None)
+        cls_dict.pop('__weakref__', None)
+        cls_dict['__slots__'] = field_names + extra_slots
+        if cls.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+            # The generated __setattr__/__delattr__ call super() on the
+            # original class, which breaks once the class is rebuilt
+            # (see also gh-90055), so we have to provide our own.
+            cls_dict['__setattr__'] = _frozen_setattr
+            cls_dict['__delattr__'] = _frozen_delattr
+        return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+    return _decorate
+
+
+# Containers for the same revinfo object are shared through these,
+# so that the decoding work is only done once.
+# The keys use the identity of the underlying asn1crypto object, which is
+# cheap to look up regardless of its size. Since the container holds on to
+# that object, its id() can't be recycled while the entry is alive.
+_INTERNED_OCSP: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+_INTERNED_CRLS: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+
+class _ParsedOCSP(NamedTuple):
+    """
+    The parts of an OCSP response that are needed to process
+    a particular ``SingleResponse``.
+    """
+
+    basic_ocsp_response: Optional[ocsp.BasicOCSPResponse]
+    single_response: Optional[ocsp.SingleResponse] = None
+    this_update: Optional[datetime] = None
+    next_update: Optional[datetime] = None
+
+
+def _parse_ocsp(
+    basic_ocsp_response: Optional[ocsp.BasicOCSPResponse],
+    single_response: Optional[ocsp.SingleResponse],
+) -> _ParsedOCSP:
+    if single_response is None:
+        return _ParsedOCSP(basic_ocsp_response)
+    return _ParsedOCSP(
+        basic_ocsp_response,
+        single_response,
+        this_update=_fast_time(single_response['this_update']),
+        next_update=_fast_time(single_response['next_update']),
+    )
+
+
+@_add_slots('_decoded_cache', '__weakref__')
 @dataclass(frozen=True)
 class OCSPContainer(RevinfoContainer):
     """
@@ -273,6 +547,9 @@ class OCSPContainer(RevinfoContainer):
     response object retrieved from the server, if applicable.
     """
 
+    def __reduce__(self):
+        return self.__class__, (self.ocsp_response_data, self.index)
+
     @classmethod
     def load_multi(
         cls, ocsp_response: ocsp.OCSPResponse
@@ -295,28 +572,81 @@ class OCSPContainer(RevinfoContainer):
             return []
         tbs_response = basic_ocsp_response['tbs_response_data']
 
-        return [
-            OCSPContainer(ocsp_response_data=ocsp_response, index=ix)
-            for ix in range(len(tbs_response['responses']))
-        ]
+        result = []
+        for ix, cert_response in enumerate(tbs_response['responses']):
+            container = OCSPContainer.get_or_create(ocsp_response, ix)
+            # We've parsed the response anyway, so we might as well
+            # populate the decoding cache right away.
+            # If this fails, the error will resurface in context when the
+            # container is actually used.
+            if getattr(container, '_decoded_cache', None) is None:
+                try:
+                    decoded = _parse_ocsp(basic_ocsp_response, cert_response)
+                    object.__setattr__(container, '_decoded_cache', decoded)
+                except ValueError:
+                    pass
+            result.append(container)
+        return result
+
+    @classmethod
+    def get_or_create(
+        cls, ocsp_response_data: ocsp.OCSPResponse, index: int = 0
+    ) -> 'OCSPContainer':
+        """
+        Look up or create a container for an OCSP response.
+        If a live container for the same OCSP response object and index
+        already exists, that container is returned instead of a new one.
+
+        :param ocsp_response_data:
+            An OCSP response.
+        :param index:
+            The index of the ``SingleResponse`` payload.
+        :return:
+            An :class:`.OCSPContainer`.
+        """
+        key = (cls, id(ocsp_response_data), index)
+        container = _INTERNED_OCSP.get(key)
+        if container is None:
+            container = cls(ocsp_response_data, index)
+            _INTERNED_OCSP[key] = container
+        return container
+
+    def _decoded(self) -> _ParsedOCSP:
+        # Walk the response down to the SingleResponse and its validity
+        # window only once: every lookup in the asn1crypto tree (and every
+        # .native call) would otherwise be repeated on every access.
+        # This is done lazily rather than at construction time, since callers
+        # rely on parsing errors surfacing as ValueErrors during validation.
+        decoded = getattr(self, '_decoded_cache', None)
+        if decoded is None:
+            basic_ocsp_response = _extract_basic_ocsp_response(
+                self.ocsp_response_data
+            )
+            cert_response = None
+            if basic_ocsp_response is not None:
+                responses = basic_ocsp_response['tbs_response_data'][
+                    'responses'
+                ]
+                if len(responses) > self.index:
+                    cert_response = responses[self.index]
+            decoded = _parse_ocsp(basic_ocsp_response, cert_response)
+            object.__setattr__(self, '_decoded_cache', decoded)
+        return decoded
 
     @property
     def issuance_date(self) -> Optional[datetime]:
-        cert_response = self.extract_single_response()
-        if cert_response is None:
-            return None
+        return self._decoded().this_update
 
-        return cert_response['this_update'].native
+    def _validity_window(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        # if there's no SingleResponse, this_update is None
+        # and the judgment will be UNCLEAR
+        decoded = self._decoded()
+        return decoded.this_update, decoded.next_update
 
     def usable_at(
         self, policy: CertRevTrustPolicy, timing_params: ValidationTimingParams
     ) -> RevinfoUsability:
-        cert_response = self.extract_single_response()
-        if cert_response is None:
-            return RevinfoUsability(RevinfoUsabilityRating.UNCLEAR)
-
-        this_update = cert_response['this_update'].native
-        next_update = cert_response['next_update'].native
+        this_update, next_update = self._validity_window()
         return _judge_revinfo(
             this_update,
             next_update,
@@ -330,7 +660,7 @@ class OCSPContainer(RevinfoContainer):
         the OCSP response is a standard, non-error response).
         """
 
-        return _extract_basic_ocsp_response(self.ocsp_response_data)
+        return self._decoded().basic_ocsp_response
 
     def extract_single_response(self) -> Optional[ocsp.SingleResponse]:
         """
@@ -338,14 +668,7 @@ class OCSPContainer(RevinfoContainer):
         index.
         """
 
-        basic_ocsp_response = self.extract_basic_ocsp_response()
-        if basic_ocsp_response is None:
-            return None
-        tbs_response = basic_ocsp_response['tbs_response_data']
-
-        if len(tbs_response['responses']) <= self.index:
-            return None
-        return tbs_response['responses'][self.index]
+        return self._decoded().single_response
 
     @property
     def revinfo_sig_mechanism_used(
@@ -355,6 +678,7 @@ class OCSPContainer(RevinfoContainer):
         return None if basic_resp is None else basic_resp['signature_algorithm']
 
 
+@_add_slots('_decoded_cache', '__weakref__')
 @dataclass(frozen=True)
 class CRLContainer(RevinfoContainer):
     """
@@ -366,20 +690,54 @@ class CRLContainer(RevinfoContainer):
     The CRL data.
     """
 
+    @classmethod
+    def get_or_create(cls, crl_data: crl.CertificateList) -> 'CRLContainer':
+        """
+        Look up or create a container for a CRL.
+        If a live container for the same CRL object already exists,
+        that container is returned instead of a new one.
+
+        :param crl_data:
+            The CRL data.
+        :return:
+            A :class:`.CRLContainer`.
+        """
+        key = (cls, id(crl_data))
+        container = _INTERNED_CRLS.get(key)
+        if container is None:
+            container = cls(crl_data)
+            _INTERNED_CRLS[key] = container
+        return container
+
+    def __reduce__(self):
+        return self.__class__, (self.crl_data,)
+
+    def _decoded(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        # see OCSPContainer._decoded()
+        decoded = getattr(self, '_decoded_cache', None)
+        if decoded is None:
+            tbs_cert_list = self.crl_data['tbs_cert_list']
+            decoded = (
+                _fast_time(tbs_cert_list['this_update']),
+                _fast_time(tbs_cert_list['next_update']),
+            )
+            object.__setattr__(self, '_decoded_cache', decoded)
+        return decoded
+
+    def _validity_window(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        return self._decoded()
+
     def usable_at(
         self, policy: CertRevTrustPolicy, timing_params: ValidationTimingParams
     ) -> RevinfoUsability:
-        tbs_cert_list = self.crl_data['tbs_cert_list']
-        this_update = tbs_cert_list['this_update'].native
-        next_update = tbs_cert_list['next_update'].native
+        this_update, next_update = self._decoded()
         return _judge_revinfo(
             this_update, next_update, policy=policy, timing_params=timing_params
         )
 
     @property
     def issuance_date(self) -> Optional[datetime]:
-        tbs_cert_list = self.crl_data['tbs_cert_list']
-        return tbs_cert_list['this_update'].native
+        return self._decoded()[0]
 
     @property
     def revinfo_sig_mechanism_used(self) -> algos.SignedDigestAlgorithm:
@@ -408,7 +766,7 @@ def process_legacy_crl_input(
         if isinstance(crl_, bytes):
             crl_ = crl.CertificateList.load(crl_)
         if isinstance(crl_, crl.CertificateList):
-            crl_ = CRLContainer(crl_)
+            crl_ = CRLContainer.get_or_create(crl_)
         if isinstance(crl_, CRLContainer):
             new_crls.append(crl_)
         else:
@@ -183,7 +183,7 @@ class RevinfoManager:
             crls = fetchers.crl_fetcher.fetched_crls_for_cert(cert)
         except KeyError:
             crls = await fetchers.crl_fetcher.fetch(cert)
-        conts = [CRLContainer(crl_data) for crl_data in crls]
+        conts = [CRLContainer.get_or_create(crl_data) for crl_data in crls]
         return conts + self._crls
 
     async def async_retrieve_ocsps(
@@ -207,7 +207,7 @@ class RevinfoManager:
 
         fetchers = self._fetchers
         ocsps = [
-            OCSPContainer(resp)
+            OCSPContainer.get_or_create(resp)
             for resp in fetchers.ocsp_fetcher.fetched_responses_for_cert(cert)
         ]
         if not ocsps:
@@ -597,10 +597,10 @@ async def _handle_single_crl(
         timing_params=validation_context.timing_params,
     )
     rating = freshness_result.rating
-    if rating != RevinfoUsabilityRating.OK:
-        if rating == RevinfoUsabilityRating.STALE:
+    if rating is not RevinfoUsabilityRating.OK:
+        if rating is RevinfoUsabilityRating.STALE:
             msg = 'CRL is not recent enough'
-        elif rating == RevinfoUsabilityRating.TOO_NEW:
+        elif rating is RevinfoUsabilityRating.TOO_NEW:
             msg = 'CRL is too recent'
         else:
             msg = 'CRL freshness could not be established'
@@ -751,10 +751,10 @@ def _maybe_get_delta_crl(
             policy=policy, timing_params=timing_params
         )
         rating = freshness_result.rating
-        if rating != RevinfoUsabilityRating.OK:
-            if rating == RevinfoUsabilityRating.STALE:
+        if rating is not RevinfoUsabilityRating.OK:
+            if rating is RevinfoUsabilityRating.STALE:
                 msg = 'Delta CRL is stale'
-            elif rating == RevinfoUsabilityRating.TOO_NEW:
+            elif rating is RevinfoUsabilityRating.TOO_NEW:
                 msg = 'Delta CRL is too recent'
             else:
                 msg = 'Delta CRL freshness could not be established'
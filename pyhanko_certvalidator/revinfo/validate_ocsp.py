@@ -426,6 +426,16 @@ def _assess_ocsp_relevance(
     if not matched:
         return None
 
+    return _authenticate_ocsp_response(
+        ocsp_response, cert_store=cert_store, errs=errs
+    )
+
+
+def _authenticate_ocsp_response(
+    ocsp_response: OCSPContainer,
+    cert_store: CertificateCollection,
+    errs: _OCSPErrs,
+) -> Optional[x509.Certificate]:
     responder_cert = _identify_responder_cert(
         ocsp_response, cert_store=cert_store, errs=errs
     )
@@ -451,31 +461,37 @@ async def _handle_single_ocsp_resp(
     errs: _OCSPErrs,
     proc_state: ValProcState,
 ) -> bool:
-    responder_cert = _assess_ocsp_relevance(
-        cert=cert,
-        issuer=issuer,
-        ocsp_response=ocsp_response,
-        cert_store=validation_context.certificate_registry,
-        errs=errs,
+    matched = _match_ocsp_certid(
+        cert, issuer=issuer, ocsp_response=ocsp_response, errs=errs
     )
-    if responder_cert is None:
+    if not matched:
         return False
 
+    # The freshness check is cheap, so do it before we get to
+    # locating the responder and verifying the signature.
     freshness_result = ocsp_response.usable_at(
         policy=validation_context.revinfo_policy,
         timing_params=validation_context.timing_params,
     )
     rating = freshness_result.rating
-    if rating != RevinfoUsabilityRating.OK:
-        if rating == RevinfoUsabilityRating.STALE:
+    if rating is not RevinfoUsabilityRating.OK:
+        if rating is RevinfoUsabilityRating.STALE:
             msg = 'OCSP response is not recent enough'
-        elif rating == RevinfoUsabilityRating.TOO_NEW:
+        elif rating is RevinfoUsabilityRating.TOO_NEW:
             msg = 'OCSP response is too recent'
         else:
             msg = 'OCSP response freshness could not be established'
         errs.failures.append((msg, ocsp_response))
         return False
 
+    responder_cert = _authenticate_ocsp_response(
+        ocsp_response,
+        cert_store=validation_context.certificate_registry,
+        errs=errs,
+    )
+    if responder_cert is None:
+        return False
+
     # check whether the responder cert is authorised
     authorised = await _check_ocsp_authorisation(
         responder_cert,
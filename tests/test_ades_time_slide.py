@@ -210,7 +210,7 @@ async def test_time_slide_revoked_intermediate_enforce_cert_poe():
         crls=[CRLContainer(root_crl), CRLContainer(interm_crl)],
         ocsps=[],
     )
-    with pytest.raises(InsufficientPOEError, match='for.*Alice'):
+    with pytest.raises(InsufficientPOEError, match='for.*Alice') as exc_info:
         await time_slide(
             test_path,
             init_control_time=now(),
@@ -219,6 +219,8 @@ async def test_time_slide_revoked_intermediate_enforce_cert_poe():
             algo_usage_policy=None,
             time_tolerance=DEFAULT_TOLERANCE,
         )
+    (msg,) = exc_info.value.args
+    assert msg.startswith('No proof of existence available for certificate')
 
 
 @pytest.mark.asyncio
@@ -241,7 +243,9 @@ async def test_time_slide_revoked_intermediate_enforce_revinfo_poe():
         crls=[CRLContainer(root_crl), CRLContainer(interm_crl)],
         ocsps=[],
     )
-    with pytest.raises(InsufficientRevinfoError, match='for.*Alice'):
+    with pytest.raises(
+        InsufficientRevinfoError, match='for.*Alice'
+    ) as exc_info:
         await time_slide(
             test_path,
             init_control_time=now(),
@@ -250,6 +254,8 @@ async def test_time_slide_revoked_intermediate_enforce_revinfo_poe():
             algo_usage_policy=None,
             time_tolerance=DEFAULT_TOLERANCE,
         )
+    (msg,) = exc_info.value.args
+    assert msg.startswith('No revocation info from before')
 
 
 VALIDATION_POLICY_SPEC = CertValidationPolicySpec(
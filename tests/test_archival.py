@@ -0,0 +1,360 @@
+import dataclasses
+import os
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from asn1crypto import core, crl, ocsp, x509
+
+from pyhanko_certvalidator import ValidationContext
+from pyhanko_certvalidator.fetchers import CRLFetcher, Fetchers
+from pyhanko_certvalidator.ltv.poe import POEManager
+from pyhanko_certvalidator.ltv.types import (
+    ValidationTimingInfo,
+    ValidationTimingParams,
+)
+from pyhanko_certvalidator.policy_decl import (
+    CertRevTrustPolicy,
+    FreshnessReqType,
+    RevocationCheckingPolicy,
+)
+from pyhanko_certvalidator.registry import CertificateRegistry
+from pyhanko_certvalidator.revinfo import archival
+from pyhanko_certvalidator.revinfo.archival import (
+    CRLContainer,
+    OCSPContainer,
+    RevinfoUsabilityRating,
+    _fast_time,
+    _make_revinfo_judge,
+    batch_usable_at,
+)
+from pyhanko_certvalidator.revinfo.manager import RevinfoManager
+from pyhanko_certvalidator.validate import async_validate_path
+
+from .common import (
+    load_cert_object,
+    load_crl,
+    load_nist_crl,
+    load_ocsp_response,
+)
+
+CERTS_DIR = os.path.join('freshness', 'certs')
+
+
+@pytest.mark.parametrize(
+    'der_value',
+    [
+        b'20201001000000Z',
+        b'19991231235959Z',
+        b'20500101000000Z',
+    ],
+)
+def test_fast_time_generalized(der_value):
+    node = core.GeneralizedTime.load(b'\x18\x0f' + der_value)
+    assert _fast_time(node) == node.native
+
+
+@pytest.mark.parametrize(
+    'der_value',
+    [
+        b'201001000000Z',
+        b'491231235959Z',
+        b'500101000000Z',
+        b'990101000000Z',
+    ],
+)
+def test_fast_time_utc(der_value):
+    node = core.UTCTime.load(b'\x17\x0d' + der_value)
+    assert _fast_time(node) == node.native
+
+
+def test_fast_time_fallback():
+    # fractional seconds are not DER, but asn1crypto accepts them
+    node = core.GeneralizedTime.load(b'\x18\x13' + b'20201001000000.123Z')
+    assert _fast_time(node) == node.native
+
+
+def test_fast_time_choice():
+    node = x509.Time(
+        name='utc_time',
+        value=datetime(2020, 10, 1, tzinfo=timezone.utc),
+    )
+    assert _fast_time(node) == datetime(2020, 10, 1, tzinfo=timezone.utc)
+    assert _fast_time(core.Void()) is None
+
+
+def test_ocsp_container_decode():
+    resp = load_ocsp_response('freshness', 'alice-2020-10-01.ors')
+    (cont,) = OCSPContainer.load_multi(resp)
+    single_resp = cont.extract_single_response()
+    assert single_resp is not None
+    assert cont.issuance_date == single_resp['this_update'].native
+    assert cont.extract_single_response() is single_resp
+
+
+def test_crl_container_decode():
+    for crl_data in (
+        load_crl('freshness', 'root-2020-10-01.crl'),
+        load_nist_crl('GoodCACRL.crl'),
+    ):
+        cont = CRLContainer(crl_data)
+        tbs_cert_list = crl_data['tbs_cert_list']
+        assert cont.issuance_date == tbs_cert_list['this_update'].native
+        assert cont._decoded() == (
+            tbs_cert_list['this_update'].native,
+            tbs_cert_list['next_update'].native,
+        )
+
+
+@pytest.mark.parametrize(
+    'freshness_req_type,freshness',
+    [
+        (FreshnessReqType.DEFAULT, None),
+        (FreshnessReqType.TIME_AFTER_SIGNATURE, timedelta(days=3)),
+        (FreshnessReqType.MAX_DIFF_REVOCATION_VALIDATION, timedelta(days=1)),
+        (FreshnessReqType.MAX_DIFF_REVOCATION_VALIDATION, None),
+    ],
+)
+@pytest.mark.parametrize('day', [1, 10, 29])
+def test_batch_usable_at(freshness_req_type, freshness, day):
+    policy = CertRevTrustPolicy(
+        revocation_checking_policy=RevocationCheckingPolicy.from_legacy(
+            'require'
+        ),
+        freshness=freshness,
+        freshness_req_type=freshness_req_type,
+    )
+    moment = datetime(2020, 10, day, tzinfo=timezone.utc)
+    timing_params = ValidationTimingParams(
+        ValidationTimingInfo(
+            validation_time=moment,
+            best_signature_time=moment - timedelta(days=5),
+            point_in_time_validation=True,
+        ),
+        time_tolerance=timedelta(seconds=1),
+    )
+    containers = [
+        *OCSPContainer.load_multi(
+            load_ocsp_response('freshness', 'alice-2020-10-01.ors')
+        ),
+        *OCSPContainer.load_multi(
+            load_ocsp_response('freshness', 'alice-2020-11-29.ors')
+        ),
+        CRLContainer(load_crl('freshness', 'root-2020-10-01.crl')),
+        CRLContainer(load_crl('freshness', 'root-2020-11-29.crl')),
+    ]
+    expected = [c.usable_at(policy, timing_params) for c in containers]
+    assert batch_usable_at(containers, policy, timing_params) == expected
+
+
+def _timing_params(day, tolerance=timedelta(seconds=1)):
+    moment = datetime(2020, 10, day, tzinfo=timezone.utc)
+    return ValidationTimingParams(
+        ValidationTimingInfo(
+            validation_time=moment,
+            best_signature_time=moment,
+            point_in_time_validation=True,
+        ),
+        time_tolerance=tolerance,
+    )
+
+
+def test_judge_reused():
+    policy = CertRevTrustPolicy(
+        revocation_checking_policy=RevocationCheckingPolicy.from_legacy(
+            'require'
+        ),
+        freshness=timedelta(days=10),
+        freshness_req_type=FreshnessReqType.MAX_DIFF_REVOCATION_VALIDATION,
+    )
+    timing_params = _timing_params(1)
+    judge = _make_revinfo_judge(policy, timing_params)
+    assert _make_revinfo_judge(policy, timing_params) is judge
+
+    cont = CRLContainer(load_crl('freshness', 'root-2020-10-01.crl'))
+    assert cont.usable_at(policy, timing_params).rating is (
+        RevinfoUsabilityRating.OK
+    )
+    assert _make_revinfo_judge(policy, timing_params) is judge
+
+    # equal, but not identical, parameters get a new judge,
+    # and the judge follows the new parameters
+    later = _timing_params(10)
+    assert _make_revinfo_judge(policy, later) is not judge
+    assert cont.usable_at(policy, later).rating is (
+        RevinfoUsabilityRating.STALE
+    )
+    assert cont.usable_at(policy, timing_params).rating is (
+        RevinfoUsabilityRating.OK
+    )
+
+
+@pytest.mark.asyncio
+async def test_judge_reused_by_validators():
+    certs = CERTS_DIR
+    vc = ValidationContext(
+        trust_roots=[load_cert_object(certs, 'root.crt')],
+        other_certs=[load_cert_object(certs, 'interm.crt')],
+        ocsps=[load_ocsp_response('freshness', 'alice-2020-10-01.ors')],
+        crls=[load_crl('freshness', 'root-2020-10-01.crl')],
+        revinfo_policy=CertRevTrustPolicy(
+            revocation_checking_policy=RevocationCheckingPolicy.from_legacy(
+                'require'
+            ),
+        ),
+        moment=datetime(2020, 10, 1, tzinfo=timezone.utc),
+    )
+    alice = load_cert_object(certs, 'alice.crt')
+    (path,) = await vc.path_builder.async_build_paths(alice)
+    await async_validate_path(vc, path)
+    assert archival._last_judge is not None
+    policy, timing_params, judge = archival._last_judge
+    assert policy is vc.revinfo_policy
+    assert timing_params is vc.timing_params
+    assert _make_revinfo_judge(vc.revinfo_policy, vc.timing_params) is judge
+
+
+def test_container_immutable():
+    resp = load_ocsp_response('freshness', 'alice-2020-10-01.ors')
+    cont = OCSPContainer(resp)
+    assert cont == OCSPContainer(resp)
+    assert cont != OCSPContainer(resp, index=1)
+    assert hash(cont) == hash(OCSPContainer(resp))
+    with pytest.raises(AttributeError):
+        cont.index = 1  # type: ignore[misc]
+
+    # not just the fields
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cont.foo = 1  # type: ignore[attr-defined]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        del cont.foo  # type: ignore[attr-defined]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cont._decoded_cache = None  # type: ignore[misc]
+
+    crl_cont = CRLContainer(load_crl('freshness', 'root-2020-10-01.crl'))
+    assert crl_cont == CRLContainer(crl_cont.crl_data)
+    with pytest.raises(AttributeError):
+        crl_cont.crl_data = None  # type: ignore[misc]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        crl_cont.foo = 1  # type: ignore[attr-defined]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        del crl_cont.crl_data
+    # the decode cache is still populated behind the scenes
+    assert crl_cont.issuance_date is not None
+
+
+def test_container_interning():
+    resp = load_ocsp_response('freshness', 'alice-2020-10-01.ors')
+    (cont,) = OCSPContainer.load_multi(resp)
+    assert OCSPContainer.get_or_create(resp) is cont
+    assert OCSPContainer.load_multi(resp) == [cont]
+    assert OCSPContainer.load_multi(resp)[0] is cont
+    assert OCSPContainer.get_or_create(resp, index=1) is not cont
+    # interning is by identity, not content
+    resp_copy = ocsp.OCSPResponse.load(resp.dump())
+    assert OCSPContainer.get_or_create(resp_copy) is not cont
+
+    crl_data = load_crl('freshness', 'root-2020-10-01.crl')
+    crl_cont = CRLContainer.get_or_create(crl_data)
+    assert CRLContainer.get_or_create(crl_data) is crl_cont
+    crl_copy = crl.CertificateList.load(crl_data.dump())
+    assert CRLContainer.get_or_create(crl_copy) is not crl_cont
+
+
+class _StaticCRLFetcher(CRLFetcher):
+    # mimics the caching behaviour of the real fetchers
+    def __init__(self, crls):
+        self._crls = crls
+        self._fetched = False
+
+    async def fetch(self, cert, *, use_deltas=None):
+        self._fetched = True
+        return self._crls
+
+    def fetched_crls(self):
+        return self._crls if self._fetched else []
+
+    def fetched_crls_for_cert(self, cert):
+        if not self._fetched:
+            raise KeyError(cert)
+        return self._crls
+
+
+@pytest.mark.asyncio
+async def test_retrieve_crls_reuses_containers():
+    crl_data = load_crl('freshness', 'root-2020-10-01.crl')
+    manager = RevinfoManager(
+        certificate_registry=CertificateRegistry(),
+        poe_manager=POEManager(),
+        crls=[],
+        ocsps=[],
+        fetchers=Fetchers(
+            ocsp_fetcher=None,  # type: ignore[arg-type]
+            crl_fetcher=_StaticCRLFetcher([crl_data]),
+            cert_fetcher=None,  # type: ignore[arg-type]
+        ),
+    )
+    alice = load_cert_object(CERTS_DIR, 'alice.crt')
+    (cont,) = await manager.async_retrieve_crls(alice)
+    assert cont.issuance_date is not None
+    (cont_again,) = await manager.async_retrieve_crls(alice)
+    assert cont_again is cont
+
+
+def test_container_dataclass_compat():
+    resp = load_ocsp_response('freshness', 'alice-2020-10-01.ors')
+    cont = OCSPContainer(resp)
+    assert not hasattr(cont, '__dict__')
+    assert [f.name for f in dataclasses.fields(cont)] == [
+        'ocsp_response_data',
+        'index',
+    ]
+    assert dataclasses.replace(cont, index=1) == OCSPContainer(resp, index=1)
+    assert dataclasses.asdict(cont)['index'] == 0
+    cont_copy = pickle.loads(pickle.dumps(cont))
+    assert cont_copy.ocsp_response_data.dump() == resp.dump()
+    assert cont_copy.index == 0
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cont.index = 1  # type: ignore[misc]
+
+    crl_cont = CRLContainer(load_crl('freshness', 'root-2020-10-01.crl'))
+    assert not hasattr(crl_cont, '__dict__')
+    assert dataclasses.replace(crl_cont) == crl_cont
+    crl_cont_copy = pickle.loads(pickle.dumps(crl_cont))
+    assert crl_cont_copy.crl_data.dump() == crl_cont.crl_data.dump()
+
+
+@pytest.mark.parametrize(
+    'validation_time,expected_rating',
+    [
+        # thisUpdate is 2020-09-22, nextUpdate is 2020-10-02
+        (datetime(2020, 9, 21, 23, 49, 59), RevinfoUsabilityRating.TOO_NEW),
+        (datetime(2020, 9, 21, 23, 50), RevinfoUsabilityRating.OK),
+        (datetime(2020, 10, 2, 0, 10), RevinfoUsabilityRating.OK),
+        (datetime(2020, 10, 2, 0, 10, 1), RevinfoUsabilityRating.STALE),
+    ],
+)
+def test_default_judge_tolerance(validation_time, expected_rating):
+    policy = CertRevTrustPolicy(
+        revocation_checking_policy=RevocationCheckingPolicy.from_legacy(
+            'require'
+        ),
+    )
+    moment = validation_time.replace(tzinfo=timezone.utc)
+    timing_params = ValidationTimingParams(
+        ValidationTimingInfo(
+            validation_time=moment,
+            best_signature_time=moment,
+            point_in_time_validation=False,
+        ),
+        time_tolerance=timedelta(minutes=10),
+    )
+    cont = CRLContainer(load_crl('freshness', 'root-2020-10-01.crl'))
+    # the second call is served by the cached judge
+    for _ in range(2):
+        result = cont.usable_at(policy, timing_params)
+        assert result.rating is expected_rating
+    if expected_rating is RevinfoUsabilityRating.STALE:
+        assert result.last_usable_at == datetime(
+            2020, 10, 2, 0, 10, tzinfo=timezone.utc
+        )
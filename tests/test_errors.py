@@ -0,0 +1,101 @@
+import os
+import pickle
+from datetime import datetime, timezone
+
+from pyhanko_certvalidator._state import ValProcState
+from pyhanko_certvalidator.errors import (
+    ExpiredError,
+    PathValidationError,
+    RevokedError,
+    ValidationError,
+)
+from pyhanko_certvalidator.util import ConsList
+
+from .common import load_path
+
+
+def _proc_state(**kwargs) -> ValProcState:
+    path = load_path(
+        os.path.join('freshness', 'certs'),
+        'root.crt',
+        'interm.crt',
+        'alice.crt',
+    )
+    return ValProcState(cert_path_stack=ConsList.sing(path), **kwargs)
+
+
+def test_lazy_message():
+    calls = []
+
+    def msg():
+        calls.append(None)
+        return 'Something went wrong'
+
+    err = ValidationError(msg)
+    assert not calls
+    assert err.args == ('Something went wrong',)
+    assert str(err) == 'Something went wrong'
+    assert err.failure_msg == 'Something went wrong'
+    assert repr(err) == "ValidationError('Something went wrong')"
+    assert len(calls) == 1
+
+
+def test_lazy_message_str():
+    err = ValidationError(lambda: 'Something went wrong')
+    assert str(err) == 'Something went wrong'
+    assert err.args == ('Something went wrong',)
+
+
+def test_lazy_message_pickle():
+    err = pickle.loads(pickle.dumps(ValidationError(lambda: 'Oops')))
+    assert err.args == ('Oops',)
+    assert err.failure_msg == 'Oops'
+
+
+def test_lazy_message_override_args():
+    err = ValidationError(lambda: 'Oops')
+    err.args = ('Something else',)
+    assert str(err) == 'Something else'
+    assert err.failure_msg == 'Oops'
+
+
+def test_non_str_message():
+    err = ValidationError(None)  # type: ignore[arg-type]
+    assert err.args == (None,)
+    assert err.failure_msg is None
+    assert str(err) == 'None'
+
+
+def test_path_validation_error_attrs():
+    proc_state = _proc_state()
+    proc_state.index = proc_state.path_len
+    err = PathValidationError('Oops', proc_state=proc_state)
+    assert err.is_ee_cert is True
+    assert err.is_side_validation is proc_state.is_side_validation
+    assert err.current_path is err.original_path
+    err.is_ee_cert = False
+    err.is_side_validation = True
+    assert err.is_ee_cert is False
+    assert err.is_side_validation is True
+    # all of the above should live in slots
+    assert vars(err) == {}
+
+
+def test_path_validation_error_attrs_subclass():
+    err = ExpiredError.format(
+        expired_dt=datetime(2020, 1, 1, tzinfo=timezone.utc),
+        proc_state=_proc_state(is_side_validation=True),
+    )
+    assert err.is_ee_cert is False
+    assert err.is_side_validation is True
+    assert err.expired_dt == datetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert str(err).endswith('expired 2020-01-01 00:00:00Z')
+
+
+def test_leaf_errors_combinable():
+    # only the base classes declare non-empty slots, so downstream code
+    # can still mix the specific error types
+    class _Combined(ExpiredError, RevokedError):
+        pass
+
+    assert issubclass(_Combined, RevokedError)
@@ -5,12 +5,18 @@ import pytest
 from asn1crypto import crl, ocsp, x509
 
 from pyhanko_certvalidator import ValidationContext
-from pyhanko_certvalidator.errors import PathValidationError, RevokedError
+from pyhanko_certvalidator.errors import (
+    OCSPValidationIndeterminateError,
+    PathValidationError,
+    RevokedError,
+)
 from pyhanko_certvalidator.policy_decl import (
     CertRevTrustPolicy,
     FreshnessReqType,
     RevocationCheckingPolicy,
 )
+from pyhanko_certvalidator.revinfo import validate_ocsp
+from pyhanko_certvalidator.revinfo.validate_ocsp import verify_ocsp_response
 from pyhanko_certvalidator.validate import async_validate_path
 
 from .common import load_cert_object, load_crl, load_ocsp_response
@@ -203,3 +209,59 @@ async def test_discard_post_validation_time():
     )
     (path,) = await vc.path_builder.async_build_paths(alice)
     await async_validate_path(vc, path)
+
+
+def _spy_on_ocsp_signature_check(monkeypatch):
+    checked = []
+    orig = validate_ocsp._verify_ocsp_signature
+
+    def _verify_ocsp_signature(responder_key, ocsp_response, errs):
+        checked.append(ocsp_response)
+        return orig(responder_key, ocsp_response, errs)
+
+    monkeypatch.setattr(
+        validate_ocsp, '_verify_ocsp_signature', _verify_ocsp_signature
+    )
+    return checked
+
+
+async def _alice_ocsp_check(ors_file, moment):
+    root = load_cert_object(certs, 'root.crt')
+    alice = load_cert_object(certs, 'alice.crt')
+    interm = load_cert_object(certs, 'interm.crt')
+    policy = CertRevTrustPolicy(
+        revocation_checking_policy=RevocationCheckingPolicy.from_legacy(
+            'require'
+        ),
+    )
+    vc = ValidationContext(
+        trust_roots=[root],
+        other_certs=[interm],
+        ocsps=[load_ocsp_response(freshness_dir, ors_file)],
+        revinfo_policy=policy,
+        moment=moment,
+    )
+    (path,) = await vc.path_builder.async_build_paths(alice)
+    await verify_ocsp_response(alice, path, vc)
+
+
+@pytest.mark.asyncio
+async def test_ocsp_signature_checked_when_fresh(monkeypatch):
+    checked = _spy_on_ocsp_signature_check(monkeypatch)
+    await _alice_ocsp_check(
+        'alice-2020-10-01.ors', datetime(2020, 10, 1, tzinfo=timezone.utc)
+    )
+    assert len(checked) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_ocsp_signature_not_checked(monkeypatch):
+    checked = _spy_on_ocsp_signature_check(monkeypatch)
+    with pytest.raises(OCSPValidationIndeterminateError) as exc_info:
+        await _alice_ocsp_check(
+            'alice-2020-10-01.ors',
+            datetime(2020, 11, 29, tzinfo=timezone.utc),
+        )
+    assert not checked
+    ((msg, _),) = exc_info.value.failures
+    assert msg == 'OCSP response is not recent enough'